@@ -1,17 +1,37 @@
 import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import numpy as np
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
+# NeMo is slow to import, so it is loaded on first use by _import_nemo_asr()
+nemo_asr = None
+
 logger = logging.getLogger(__name__)
 
 
+def _import_nemo_asr():
+    """Import the NeMo ASR collection once and cache it on the module"""
+    global nemo_asr
+    if nemo_asr is None:
+        import nemo.collections.asr as nemo_asr_module
+        nemo_asr = nemo_asr_module
+    return nemo_asr
+
+
 class PerformanceMetrics:
     """Track inference performance metrics"""
 
-    def __init__(self):
-        self.rtf_history = []
+    def __init__(self, history_size: int = 100):
+        self.rtf_history: deque = deque(maxlen=history_size)
+        self._rtf_sum = 0.0
         self.inference_count = 0
         self.total_audio_duration = 0.0
         self.total_inference_time = 0.0
@@ -19,11 +39,12 @@ class PerformanceMetrics:
     def record_inference(self, audio_duration: float, inference_time: float):
         """Record an inference timing"""
         rtf = inference_time / audio_duration if audio_duration > 0 else 0.0
-        self.rtf_history.append(rtf)
 
-        # Keep only last 100 measurements
-        if len(self.rtf_history) > 100:
-            self.rtf_history.pop(0)
+        # Keep only the most recent measurements, with a running sum
+        if len(self.rtf_history) == self.rtf_history.maxlen:
+            self._rtf_sum -= self.rtf_history[0]
+        self.rtf_history.append(rtf)
+        self._rtf_sum += rtf
 
         self.inference_count += 1
         self.total_audio_duration += audio_duration
@@ -34,7 +55,7 @@ class PerformanceMetrics:
         """Get average real-time factor over recent inferences"""
         if not self.rtf_history:
             return 0.0
-        return sum(self.rtf_history) / len(self.rtf_history)
+        return self._rtf_sum / len(self.rtf_history)
 
     @property
     def overall_rtf(self) -> float:
@@ -71,6 +92,24 @@ class ASREngine:
         self.metrics = PerformanceMetrics()
         self.config = None
 
+        # Hot-path settings, cached from config by _cache_settings()
+        self._max_batch_size = 1
+        self._rtf_warning_threshold = float("inf")
+        self._sample_rate_f = 0.0
+
+        # Batch scheduler: chunks from all sessions queue here and are
+        # coalesced into model calls by _run_scheduler()
+        self._pending: deque = deque()  # (audio, future) pairs
+        self._pending_event: Optional[asyncio.Event] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._batch_wait = 0.0
+
+        # Dedicated inference thread, created on first use by _run_in_executor()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Page-locked host staging buffer for async host-to-device copies
+        self._pinned_input = None
+
     @classmethod
     async def get_instance(cls):
         """Get singleton instance"""
@@ -99,8 +138,9 @@ class ASREngine:
 
             # Import NeMo here to fail gracefully if not installed
             try:
-                import nemo.collections.asr as nemo_asr
-                import torch
+                if torch is None:
+                    raise ImportError("No module named 'torch'")
+                asr_models = _import_nemo_asr().models
             except ImportError as e:
                 raise RuntimeError(
                     f"NeMo toolkit not installed: {e}. "
@@ -109,22 +149,48 @@ class ASREngine:
 
             # Load the model
             logger.info("Downloading/loading model... This may take a while on first run.")
-            self.model = nemo_asr.models.EncDecRNNTBPEModel.from_pretrained(
+            self.model = asr_models.EncDecRNNTBPEModel.from_pretrained(
                 model_name=config.model.model_name
             )
 
             # Move to target device
             if self.device == "cuda":
                 self.model = self.model.cuda()
+
+                # Reduced precision halves weight/activation bandwidth; the
+                # preprocessor keeps computing features in float32
+                if config.performance.fp16:
+                    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                    self.model = self.model.to(dtype)
+                    logger.info(f"Using reduced precision inference: {dtype}")
             else:
                 self.model = self.model.cpu()
+                if config.performance.fp16:
+                    logger.warning("fp16 is only supported on CUDA, using float32 on CPU")
 
             # Set to evaluation mode
             self.model.eval()
 
+            # Deterministic features for streaming chunks (model.transcribe
+            # normally sets these per call)
+            self.model.preprocessor.featurizer.dither = 0.0
+            self.model.preprocessor.featurizer.pad_to = 0
+
             # Get model configuration
             self.sample_rate = self.model.cfg.sample_rate
             logger.info(f"Model sample rate: {self.sample_rate} Hz")
+            self._cache_settings()
+
+            if self.device == "cuda":
+                audio = config.audio
+                window_samples = int(
+                    (audio.left_context_duration + audio.chunk_duration) * self.sample_rate
+                )
+                self._pinned_input = torch.empty(
+                    self._max_batch_size * window_samples,
+                    dtype=torch.float32,
+                    pin_memory=True
+                )
 
             # Warm-up inference if enabled
             if config.performance.warmup_enabled:
@@ -146,6 +212,14 @@ class ASREngine:
             logger.error(f"Model loading failed: {e}", exc_info=True)
             raise RuntimeError(f"Failed to load ASR model: {e}")
 
+    def _cache_settings(self):
+        """Cache config values read on every inference as plain attributes"""
+        performance = self.config.performance
+        self._max_batch_size = max(1, performance.max_batch_size)
+        self._rtf_warning_threshold = float(performance.rtf_warning_threshold)
+        self._sample_rate_f = float(self.sample_rate)
+        self._batch_wait = max(0.0, performance.batch_wait_ms) / 1000.0
+
     def _detect_device(self, config) -> str:
         """
         Detect and validate compute device.
@@ -159,9 +233,7 @@ class ASREngine:
         Raises:
             RuntimeError: If CUDA requested but not available
         """
-        try:
-            import torch
-        except ImportError:
+        if torch is None:
             logger.warning("PyTorch not installed, defaulting to CPU")
             return "cpu"
 
@@ -192,15 +264,14 @@ class ASREngine:
     async def _warmup(self):
         """Run warm-up inference to initialize model"""
         try:
-            import torch
-
-            # Create dummy audio (1 second)
-            dummy_audio = np.random.randn(self.sample_rate).astype(np.float32)
+            # Create dummy audio (1 second); only shape and dtype matter here
+            dummy_audio = np.zeros(self.sample_rate, dtype=np.float32)
 
-            # Run inference
-            start_time = time.time()
-            _ = await self.transcribe_chunk(dummy_audio)
-            warmup_time = time.time() - start_time
+            # Run inference directly: the engine is not marked loaded yet and
+            # warm-up timings should not count towards the RTF metrics
+            start_time = time.perf_counter()
+            await self._run_in_executor(self._infer, [dummy_audio])
+            warmup_time = time.perf_counter() - start_time
 
             logger.info(f"Warm-up complete ({warmup_time:.2f}s)")
 
@@ -220,6 +291,28 @@ class ASREngine:
                 - confidence: Confidence score (placeholder)
                 - is_partial: Whether this is a partial result
 
+        Raises:
+            RuntimeError: If model not loaded or inference fails
+        """
+        results = await self.transcribe_batch([audio])
+        return results[0]
+
+    async def transcribe_batch(self, audios: List[np.ndarray]) -> List[Dict]:
+        """
+        Transcribe several audio chunks, batching them into model calls.
+
+        Chunks are queued for the batch scheduler, which coalesces chunks
+        from all sessions into model calls of at most
+        performance.max_batch_size, so concurrent sessions share GPU work
+        instead of taking turns at small batch sizes.
+
+        Args:
+            audios: List of numpy arrays of float32 audio samples
+
+        Returns:
+            List of result dictionaries (see transcribe_chunk), one per input
+            chunk and in the same order
+
         Raises:
             RuntimeError: If model not loaded or inference fails
         """
@@ -228,65 +321,276 @@ class ASREngine:
                 f"ASR model not loaded. Reason: {self.load_error or 'Model not initialized'}"
             )
 
-        try:
-            import torch
+        if not audios:
+            return []
 
-            audio_duration = len(audio) / self.sample_rate
-            start_time = time.time()
+        self._start_scheduler()
 
-            # NeMo transcribe expects list of numpy arrays
-            with torch.no_grad():
-                hypotheses = self.model.transcribe(
-                    audio=[audio],
-                    batch_size=1
-                )
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in audios]
+        self._pending.extend(zip(audios, futures))
+        self._pending_event.set()
 
-            text = hypotheses[0] if hypotheses else ""
+        texts = await asyncio.gather(*futures)
 
-            inference_time = time.time() - start_time
-            self.metrics.record_inference(audio_duration, inference_time)
+        return [
+            {
+                "text": text,
+                "confidence": 1.0,  # NeMo doesn't easily expose confidence
+                "is_partial": True
+            }
+            for text in texts
+        ]
 
-            # Log warning if RTF is high
-            if self.metrics.average_rtf > self.config.performance.rtf_warning_threshold:
-                logger.warning(
-                    f"High RTF detected: {self.metrics.average_rtf:.3f} "
-                    f"(threshold: {self.config.performance.rtf_warning_threshold})"
-                )
+    def _start_scheduler(self):
+        """Start the batch scheduler task if it is not running"""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._pending_event = asyncio.Event()
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+            self._scheduler_task.add_done_callback(self._on_scheduler_done)
 
+    def _on_scheduler_done(self, task: asyncio.Task):
+        """
+        Fail queued chunks if the scheduler task died unexpectedly.
+
+        Without this their callers would wait forever; the next
+        transcribe_batch call starts a fresh scheduler.
+
+        Args:
+            task: The finished scheduler task
+        """
+        if task.cancelled() or task.exception() is None:
+            return
+
+        logger.error("ASR batch scheduler failed", exc_info=task.exception())
+        error = RuntimeError(f"ASR batch scheduler failed: {task.exception()}")
+        while self._pending:
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def _run_scheduler(self):
+        """
+        Drain queued chunks into batched model calls.
+
+        Chunks queued while a model call is running are picked up together
+        by the next call. With performance.batch_wait_ms > 0 the scheduler
+        also waits that long for a partial batch to fill before running it.
+        """
+        pending = self._pending
+        event = self._pending_event
+
+        while True:
+            await event.wait()
+            event.clear()
+
+            if self._batch_wait and len(pending) < self._max_batch_size:
+                await asyncio.sleep(self._batch_wait)
+
+            while pending:
+                items = []
+                while pending and len(items) < self._max_batch_size:
+                    audio, future = pending.popleft()
+                    if not future.done():  # Skip chunks whose caller was cancelled
+                        items.append((audio, future))
+                if not items:
+                    continue
+
+                try:
+                    texts = await self._run_batch([audio for audio, _ in items])
+                except asyncio.CancelledError:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(RuntimeError("ASR engine shut down"))
+                    raise
+                except Exception as e:
+                    error = self._inference_error(e)
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+
+                for (_, future), text in zip(items, texts):
+                    if not future.done():
+                        future.set_result(text)
+
+    async def _run_batch(self, batch: List[np.ndarray]) -> List[str]:
+        """
+        Run one batched model call and record its metrics.
+
+        Args:
+            batch: List of numpy arrays of float32 audio samples
+
+        Returns:
+            Transcribed text for each chunk, in order
+        """
+        audio_duration = sum(len(audio) for audio in batch) / self._sample_rate_f
+
+        # Blocking model call runs off the event loop so sessions keep
+        # receiving audio (and queueing the next batch) meanwhile
+        start_time = time.perf_counter()
+        texts = await self._run_in_executor(self._infer, batch)
+        inference_time = time.perf_counter() - start_time
+        self.metrics.record_inference(audio_duration, inference_time)
+
+        # Log warning if RTF is high
+        average_rtf = self.metrics.average_rtf
+        if average_rtf > self._rtf_warning_threshold:
+            logger.warning(
+                f"High RTF detected: {average_rtf:.3f} "
+                f"(threshold: {self._rtf_warning_threshold})"
+            )
+
+        # f-strings are built eagerly, so only format when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Transcribed {audio_duration:.2f}s audio in {inference_time:.2f}s "
-                f"(RTF: {inference_time/audio_duration:.3f})"
+                f"Transcribed {len(batch)} chunk(s), {audio_duration:.2f}s audio "
+                f"in {inference_time:.2f}s (RTF: {inference_time/audio_duration:.3f})"
             )
 
-            return {
-                "text": text,
-                "confidence": 1.0,  # NeMo doesn't easily expose confidence
-                "is_partial": True
-            }
+        return texts
 
-        except Exception as e:
-            # Check for CUDA OOM
-            if "out of memory" in str(e).lower() or "CUDA" in str(e):
-                logger.error("GPU out of memory during inference")
-                if self.device == "cuda":
-                    try:
-                        import torch
-                        torch.cuda.empty_cache()
-                        logger.info("Cleared GPU cache")
-                    except:
-                        pass
-                raise RuntimeError("GPU memory exhausted during inference")
-
-            logger.error(f"Inference failed: {e}", exc_info=True)
-            raise RuntimeError(f"Transcription error: {str(e)}")
+    async def _run_in_executor(self, func, *args):
+        """
+        Run a blocking model call on the engine's inference thread.
+
+        A single dedicated worker (rather than the loop's default executor)
+        keeps model calls off threads used for unrelated blocking work and
+        serializes them; the batch scheduler supplies the parallelism.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nemo-asr")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _inference_error(self, e: Exception) -> RuntimeError:
+        """
+        Convert an inference exception into the RuntimeError raised to callers.
+
+        Args:
+            e: Exception raised by the model call
+
+        Returns:
+            RuntimeError describing the failure
+        """
+        # Check for CUDA OOM
+        if "out of memory" in str(e).lower() or "CUDA" in str(e):
+            logger.error("GPU out of memory during inference")
+            if self.device == "cuda":
+                try:
+                    torch.cuda.empty_cache()
+                    logger.info("Cleared GPU cache")
+                except:
+                    pass
+            return RuntimeError("GPU memory exhausted during inference")
+
+        logger.error(f"Inference failed: {e}", exc_info=e)
+        return RuntimeError(f"Transcription error: {str(e)}")
+
+    def _infer(self, batch: List[np.ndarray]) -> List[str]:
+        """
+        Run the model on a batch of audio chunks.
+
+        Calls the model's forward pass (preprocessor + encoder) and the RNNT
+        decoding directly on a padded tensor, bypassing model.transcribe,
+        which builds a temporary dataloader and re-runs its setup per call.
+
+        Args:
+            batch: List of numpy arrays of float32 audio samples
+
+        Returns:
+            Transcribed text for each chunk, in order
+        """
+        lengths = [len(audio) for audio in batch]
+
+        with torch.inference_mode():
+            input_signal = self._stage_input(batch, lengths)
+            input_length = torch.tensor(lengths, dtype=torch.int64, device=self.device)
+
+            encoded, encoded_len = self.model(
+                input_signal=input_signal,
+                input_signal_length=input_length
+            )
+            hypotheses = self.model.decoding.rnnt_decoder_predictions_tensor(
+                encoder_output=encoded,
+                encoded_lengths=encoded_len,
+                return_hypotheses=False
+            )
+
+        # Older NeMo versions return (best_hypotheses, all_hypotheses)
+        if isinstance(hypotheses, tuple):
+            hypotheses = hypotheses[0]
+
+        texts = []
+        for i in range(len(batch)):
+            hypothesis = hypotheses[i] if i < len(hypotheses) else ""
+            texts.append(getattr(hypothesis, "text", hypothesis))
+        return texts
+
+    def _stage_input(self, batch: List[np.ndarray], lengths: List[int]):
+        """
+        Pad a batch into a [batch, samples] tensor on the model device.
+
+        On CUDA the batch is padded straight into the pinned staging buffer,
+        so the host-to-device copy can run asynchronously (non_blocking).
+        Decoding synchronizes with the device before _infer returns, so the
+        buffer is free to reuse on the next call.
+
+        Args:
+            batch: List of numpy arrays of float32 audio samples
+            lengths: Length of each array in samples
+
+        Returns:
+            Zero-padded float32 tensor on self.device
+        """
+        shape = (len(batch), max(lengths))
+
+        if self._pinned_input is None:
+            signal = np.zeros(shape, dtype=np.float32)
+            for i, audio in enumerate(batch):
+                signal[i, :lengths[i]] = audio
+            return torch.from_numpy(signal).to(self.device)
+
+        needed = shape[0] * shape[1]
+        if needed > self._pinned_input.numel():
+            logger.debug(f"Growing pinned input buffer to {needed} samples")
+            self._pinned_input = torch.empty(needed, dtype=torch.float32, pin_memory=True)
+
+        staging = self._pinned_input[:needed].view(shape)
+        signal = staging.numpy()
+        for i, audio in enumerate(batch):
+            signal[i, :lengths[i]] = audio
+            signal[i, lengths[i]:] = 0.0
+
+        return staging.to(self.device, non_blocking=True)
 
     async def cleanup(self):
         """Clean up resources"""
         logger.info("Cleaning up ASR engine")
 
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                pass  # Already reported by _on_scheduler_done
+            self._scheduler_task = None
+
+        # Fail anything still queued
+        while self._pending:
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(RuntimeError("ASR engine shut down"))
+
+        # Let an in-flight model call finish before releasing the model
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+            self._executor = None
+
         if self.model is not None and self.device == "cuda":
             try:
-                import torch
                 # Move model to CPU to free GPU memory
                 self.model = self.model.cpu()
                 torch.cuda.empty_cache()
@@ -295,6 +599,7 @@ class ASREngine:
                 logger.warning(f"Error during cleanup: {e}")
 
         self.model = None
+        self._pinned_input = None
         self.is_loaded = False
 
     def get_stats(self) -> Dict:
@@ -1,5 +1,4 @@
 import numpy as np
-from collections import deque
 from typing import List, Optional
 import logging
 
@@ -7,6 +6,9 @@ from src.config import AudioConfig
 
 logger = logging.getLogger(__name__)
 
+# Scale factor from int16 PCM to float32 in [-1.0, 1.0] (exact in float32)
+INT16_TO_FLOAT32 = np.float32(1.0 / 32768.0)
+
 
 class AudioProcessor:
     """
@@ -30,11 +32,15 @@ class AudioProcessor:
         # Current audio buffer (incoming bytes)
         self.buffer = bytearray()
 
-        # Left context buffer (ring buffer of previous chunks)
-        max_context_chunks = int(
-            config.left_context_duration / config.chunk_duration
-        ) + 1
-        self.left_context_buffer: deque = deque(maxlen=max_context_chunks)
+        # Sliding context buffer: decoded audio is appended at _write_pos and
+        # each window [left context | chunk] is the contiguous slice ending
+        # there. The buffer holds twice the window, so the left context is only
+        # moved back to the front when it fills, not after every chunk.
+        self._context_buffer = np.zeros(
+            2 * (self.left_context_samples + self.chunk_size_samples), dtype=np.float32
+        )
+        self._write_pos = 0  # End of decoded audio in the buffer
+        self._context_samples = 0  # Valid left context samples before _write_pos
 
         # Statistics
         self.total_bytes_processed = 0
@@ -63,31 +69,55 @@ class AudioProcessor:
 
         Returns:
             List of numpy arrays, each containing:
-            [left_context + chunk + right_context]
+            [left_context + chunk + right_context]. The arrays are views into
+            the context buffer and stay valid until the next call to
+            get_inference_chunks(), flush() or reset().
 
         Note:
             Right context is not yet implemented (requires lookahead).
             Currently returns [left_context + chunk].
         """
         chunks = []
+        chunk_samples = self.chunk_size_samples
+
+        # Walk the buffer by offset and drop consumed bytes once at the end,
+        # instead of shifting the remainder down after every chunk
+        offset = 0
+        ready_end = len(self.buffer) - self.chunk_size_bytes
+        if ready_end < 0:
+            return chunks
 
-        while len(self.buffer) >= self.chunk_size_bytes:
-            # Extract one chunk worth of bytes
-            chunk_bytes = bytes(self.buffer[:self.chunk_size_bytes])
-            del self.buffer[:self.chunk_size_bytes]
+        # Make room for every ready chunk up front so no window handed out
+        # below is overwritten by a compaction
+        self._reserve((ready_end // self.chunk_size_bytes + 1) * chunk_samples)
 
-            # Convert to numpy array
-            chunk_audio = self._bytes_to_audio(chunk_bytes)
+        # Read chunks through a memoryview (no bytes copy); it must be released
+        # before the buffer is resized below
+        with memoryview(self.buffer) as buffer_view:
+            while offset <= ready_end:
+                # Extract one chunk worth of bytes
+                chunk_view = buffer_view[offset:offset + self.chunk_size_bytes]
+                offset += self.chunk_size_bytes
 
-            # Build inference input with left context
-            inference_input = self._build_with_context(chunk_audio)
+                # Decode straight into the buffer after the left context
+                write_pos = self._write_pos
+                self._bytes_to_audio(
+                    chunk_view,
+                    out=self._context_buffer[write_pos:write_pos + chunk_samples],
+                )
+                chunk_view.release()
 
-            chunks.append(inference_input)
+                # Build inference input with left context
+                inference_input = self._context_window(chunk_samples)
 
-            # Update left context buffer
-            self.left_context_buffer.append(chunk_audio)
+                chunks.append(inference_input)
 
-            self.chunks_processed += 1
+                # Slide the chunk into the left context
+                self._advance_context(chunk_samples)
+
+                self.chunks_processed += 1
+
+        del self.buffer[:offset]
 
         return chunks
 
@@ -99,40 +129,85 @@ class AudioProcessor:
             chunk: Current audio chunk
 
         Returns:
-            Concatenated audio with context
+            View of the left context followed by the chunk
+        """
+        self._reserve(len(chunk))
+        write_pos = self._write_pos
+        self._context_buffer[write_pos:write_pos + len(chunk)] = chunk
+        return self._context_window(len(chunk))
+
+    def _reserve(self, samples: int) -> None:
+        """
+        Ensure the buffer has room for `samples` more after the write position.
+
+        When it does not, the left context is moved back to the front (and the
+        buffer grown if a burst needs more than that frees up).
+
+        Args:
+            samples: Number of samples about to be written
+        """
+        write_pos = self._write_pos
+        if write_pos + samples <= len(self._context_buffer):
+            return
+
+        context = self._context_buffer[write_pos - self._context_samples:write_pos]
+        needed = self._context_samples + samples
+        if needed > len(self._context_buffer):
+            grown = np.empty(
+                max(needed, 2 * len(self._context_buffer)), dtype=np.float32
+            )
+            grown[:len(context)] = context
+            self._context_buffer = grown
+        else:
+            self._context_buffer[:len(context)] = context
+        self._write_pos = len(context)
+
+    def _context_window(self, chunk_samples: int) -> np.ndarray:
         """
-        if not self.left_context_buffer:
-            # No context yet, return just the chunk
-            return chunk
+        Return [left_context + chunk] for a chunk written at the write position.
 
-        # Concatenate all left context
-        left_context_list = list(self.left_context_buffer)
-        left_context = np.concatenate(left_context_list)
+        Args:
+            chunk_samples: Number of chunk samples after the left context
+
+        Returns:
+            View of the available left context followed by the chunk
+        """
+        write_pos = self._write_pos
+        return self._context_buffer[
+            write_pos - self._context_samples:write_pos + chunk_samples
+        ]
 
-        # Limit to max left context duration
-        if len(left_context) > self.left_context_samples:
-            left_context = left_context[-self.left_context_samples:]
+    def _advance_context(self, chunk_samples: int) -> None:
+        """
+        Move the write position past the chunk so it becomes left context.
 
-        # Combine context + chunk
-        return np.concatenate([left_context, chunk])
+        Args:
+            chunk_samples: Number of chunk samples after the left context
+        """
+        self._write_pos += chunk_samples
+        self._context_samples = min(
+            self.left_context_samples, self._context_samples + chunk_samples
+        )
 
-    def _bytes_to_audio(self, audio_bytes: bytes) -> np.ndarray:
+    def _bytes_to_audio(
+        self, audio_bytes: bytes, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Convert PCM bytes to numpy float32 array.
 
         Args:
             audio_bytes: Raw PCM audio bytes (16-bit little-endian)
+            out: Optional preallocated float32 array to write into; must hold
+                exactly len(audio_bytes) // 2 samples
 
         Returns:
             Numpy array of float32 values in range [-1.0, 1.0]
         """
-        # Convert bytes to int16 array
+        # Convert bytes to int16 array (zero-copy view)
         audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
 
-        # Convert to float32 in range [-1, 1]
-        audio_float = audio_int16.astype(np.float32) / 32768.0
-
-        return audio_float
+        # Cast and scale in a single pass, without an intermediate float array
+        return np.multiply(audio_int16, INT16_TO_FLOAT32, out=out, dtype=np.float32)
 
     def flush(self) -> Optional[np.ndarray]:
         """
@@ -144,23 +219,23 @@ class AudioProcessor:
         if len(self.buffer) == 0:
             return None
 
-        # Convert remaining bytes
-        remaining_bytes = bytes(self.buffer)
+        # Convert remaining bytes (reads the buffer in place)
+        remaining_size = len(self.buffer)
+        remaining_audio = self._bytes_to_audio(self.buffer)
         self.buffer.clear()
 
-        remaining_audio = self._bytes_to_audio(remaining_bytes)
-
         # Add context
         result = self._build_with_context(remaining_audio)
 
-        logger.debug(f"Flushed {len(remaining_bytes)} bytes")
+        logger.debug(f"Flushed {remaining_size} bytes")
 
         return result
 
     def reset(self) -> None:
         """Reset all buffers and state."""
         self.buffer.clear()
-        self.left_context_buffer.clear()
+        self._write_pos = 0
+        self._context_samples = 0
         self.total_bytes_processed = 0
         self.chunks_processed = 0
         logger.debug("AudioProcessor reset")
@@ -187,5 +262,80 @@ class AudioProcessor:
             "chunks_processed": self.chunks_processed,
             "buffer_size_bytes": len(self.buffer),
             "buffer_duration_secs": self.get_buffer_duration(),
-            "left_context_chunks": len(self.left_context_buffer)
+            "left_context_chunks": -(-self._context_samples // self.chunk_size_samples)
         }
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity ring buffer of int16 PCM samples.
+
+    Keeps the most recent `capacity` samples in a preallocated array, so
+    writes never reallocate and older audio is overwritten once full.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._ring = np.zeros(self.capacity, dtype=np.int16)
+        self._write = 0  # Next write position
+        self._size = 0  # Number of valid samples
+        self._pending = b""  # Odd trailing byte from the last write
+
+    def write(self, audio_data: bytes) -> None:
+        """
+        Append raw 16-bit PCM bytes, overwriting the oldest samples when full.
+
+        Args:
+            audio_data: Raw PCM audio bytes (may split a sample across calls)
+        """
+        if self._pending:
+            audio_data = self._pending + bytes(audio_data)
+
+        usable = len(audio_data) & ~1
+        self._pending = bytes(audio_data[usable:])
+
+        samples = np.frombuffer(audio_data, dtype=np.int16, count=usable // 2)
+        n = len(samples)
+        if n == 0:
+            return
+
+        capacity = self.capacity
+        if n >= capacity:
+            self._ring[:] = samples[-capacity:]
+            self._write = 0
+            self._size = capacity
+            return
+
+        # Copy in at most two slices, wrapping around the end
+        first = min(n, capacity - self._write)
+        self._ring[self._write:self._write + first] = samples[:first]
+        self._ring[:n - first] = samples[first:]
+
+        self._write = (self._write + n) % capacity
+        self._size = min(capacity, self._size + n)
+
+    def get_window(self, n_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent samples in chronological order.
+
+        Args:
+            n_samples: Number of samples to return (default: all stored)
+
+        Returns:
+            int16 array; a view into the ring unless the window wraps
+        """
+        n = self._size if n_samples is None else min(n_samples, self._size)
+        start = (self._write - n) % self.capacity
+
+        if start + n <= self.capacity:
+            return self._ring[start:start + n]
+        return np.concatenate((self._ring[start:], self._ring[:self._write]))
+
+    def clear(self) -> None:
+        """Drop all stored audio"""
+        self._write = 0
+        self._size = 0
+        self._pending = b""
+
+    def __len__(self) -> int:
+        return self._size
@@ -1,12 +1,108 @@
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Optional
+import json
 import os
+import tempfile
 import logging
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# libyaml's C loader is several times faster than the pure-Python one
+if yaml is not None:
+    _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
+# Environment variables read by Config.load (part of its cache key)
+_ENV_VARS = (
+    "ASR_MODEL_NAME", "ASR_DEVICE", "ASR_CACHE_DIR",
+    "ASR_SAMPLE_RATE", "ASR_CHUNK_DURATION", "ASR_LEFT_CONTEXT", "ASR_RIGHT_CONTEXT",
+    "ENDPOINTING_STRATEGY", "ENDPOINTING_ENERGY_THRESHOLD", "ENDPOINTING_SILENCE_DURATION",
+    "VAD_ENABLED",
+    "MAX_BATCH_SIZE", "BATCH_WAIT_MS", "MAX_SESSION_DURATION", "MAX_BUFFER_SIZE",
+    "WARMUP_ENABLED", "ASR_FP16",
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an int environment variable, using default if unset or empty"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, using default if unset or empty"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a "true"/"false" environment variable, using default if unset or empty"""
+    value = os.environ.get(name)
+    return value.lower() == "true" if value else default
+
+
+def _read_config_file(config_file: str) -> dict:
+    """
+    Read a YAML config file through a JSON sidecar cache.
+
+    The parsed YAML is written to `<config_file>.cache.json` together with the
+    YAML file's mtime (in ns) and size, and reused only while both still match
+    exactly, so later startups skip YAML parsing.
+
+    Args:
+        config_file: Path to YAML config file
+
+    Returns:
+        Parsed config data
+    """
+    cache_path = config_file + '.cache.json'
+
+    with open(config_file, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        key = [stat.st_mtime_ns, stat.st_size]
+
+        try:
+            with open(cache_path, 'r') as cache:
+                cached = json.load(cache)
+            if cached['key'] == key:
+                return cached['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # No usable cache, parse the YAML
 
-@dataclass
+        if yaml is None:
+            raise ImportError("PyYAML is required to load config files")
+
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Write to a temp file and rename it into place, so a failed write never
+    # leaves a truncated cache behind
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path) or '.',
+            prefix=os.path.basename(cache_path) + '.',
+            suffix='.tmp',
+        )
+        with os.fdopen(fd, 'w') as cache:
+            json.dump({'key': key, 'data': data}, cache)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return data
+
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for ASR model"""
     model_name: str = "nvidia/parakeet-tdt-0.6b-v3"
@@ -14,7 +110,7 @@ class ModelConfig:
     cache_dir: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioConfig:
     """Configuration for audio processing"""
     sample_rate: int = 16000  # 16kHz
@@ -24,7 +120,7 @@ class AudioConfig:
     audio_format: str = "pcm_s16le"  # PCM 16-bit little-endian
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EndpointingConfig:
     """Configuration for endpointing (utterance boundary detection)"""
     strategy: str = "energy"  # "energy" or "vad"
@@ -34,17 +130,19 @@ class EndpointingConfig:
     vad_enabled: bool = False  # Enable VAD-based endpointing
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceConfig:
     """Configuration for performance limits and monitoring"""
-    max_batch_size: int = 1  # Single user for now
+    max_batch_size: int = 4  # Max chunks per model call when several are ready
+    batch_wait_ms: float = 0.0  # Extra wait for a partial batch to fill (0 = none)
     max_session_duration: int = 3600  # 1 hour max session length (seconds)
     max_buffer_size: int = 160000  # Max audio buffer size (~10 seconds at 16kHz)
     warmup_enabled: bool = True  # Run warmup inference on startup
     rtf_warning_threshold: float = 0.9  # Warn if RTF exceeds this
+    fp16: bool = False  # Half precision (bf16 if supported) inference on CUDA
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration for the ASR service"""
     model: ModelConfig = field(default_factory=ModelConfig)
@@ -57,17 +155,36 @@ class Config:
         """
         Load configuration from file or environment variables.
 
+        Results are memoized per config file modification time and values of
+        the environment variables read, so repeated loads are cheap. Configs
+        are frozen, so sharing one instance is safe.
+
         Args:
             config_file: Optional path to YAML config file
 
         Returns:
             Config instance
         """
+        try:
+            mtime = os.path.getmtime(config_file) if config_file else None
+        except OSError:
+            mtime = None
+
+        environ = os.environ
+        env = tuple(environ.get(name) for name in _ENV_VARS)
+        return _load_cached(cls, config_file, mtime, env)
+
+    @staticmethod
+    def clear_cache():
+        """Drop memoized results of Config.load"""
+        _load_cached.cache_clear()
+
+    @classmethod
+    def _load(cls, config_file: Optional[str]) -> 'Config':
+        """Load configuration without memoization (see load)"""
         if config_file and os.path.exists(config_file):
             try:
-                import yaml
-                with open(config_file, 'r') as f:
-                    data = yaml.safe_load(f)
+                data = _read_config_file(config_file)
 
                 return cls(
                     model=ModelConfig(**data.get('model', {})),
@@ -80,30 +197,35 @@ class Config:
                 logger.info("Using default configuration")
 
         # Load from environment variables or use defaults
+        get = os.environ.get
+
         model_config = ModelConfig(
-            model_name=os.getenv("ASR_MODEL_NAME", "nvidia/parakeet-tdt-0.6b-v3"),
-            device=os.getenv("ASR_DEVICE", "auto"),
-            cache_dir=os.getenv("ASR_CACHE_DIR")
+            model_name=get("ASR_MODEL_NAME", "nvidia/parakeet-tdt-0.6b-v3"),
+            device=get("ASR_DEVICE", "auto"),
+            cache_dir=get("ASR_CACHE_DIR")
         )
 
         audio_config = AudioConfig(
-            sample_rate=int(os.getenv("ASR_SAMPLE_RATE", "16000")),
-            chunk_duration=float(os.getenv("ASR_CHUNK_DURATION", "1.0")),
-            left_context_duration=float(os.getenv("ASR_LEFT_CONTEXT", "10.0")),
-            right_context_duration=float(os.getenv("ASR_RIGHT_CONTEXT", "2.0"))
+            sample_rate=_env_int("ASR_SAMPLE_RATE", 16000),
+            chunk_duration=_env_float("ASR_CHUNK_DURATION", 1.0),
+            left_context_duration=_env_float("ASR_LEFT_CONTEXT", 10.0),
+            right_context_duration=_env_float("ASR_RIGHT_CONTEXT", 2.0)
         )
 
         endpointing_config = EndpointingConfig(
-            strategy=os.getenv("ENDPOINTING_STRATEGY", "energy"),
-            energy_threshold=float(os.getenv("ENDPOINTING_ENERGY_THRESHOLD", "0.01")),
-            silence_duration=float(os.getenv("ENDPOINTING_SILENCE_DURATION", "0.8")),
-            vad_enabled=os.getenv("VAD_ENABLED", "false").lower() == "true"
+            strategy=get("ENDPOINTING_STRATEGY", "energy"),
+            energy_threshold=_env_float("ENDPOINTING_ENERGY_THRESHOLD", 0.01),
+            silence_duration=_env_float("ENDPOINTING_SILENCE_DURATION", 0.8),
+            vad_enabled=_env_bool("VAD_ENABLED", False)
         )
 
         performance_config = PerformanceConfig(
-            max_session_duration=int(os.getenv("MAX_SESSION_DURATION", "3600")),
-            max_buffer_size=int(os.getenv("MAX_BUFFER_SIZE", "160000")),
-            warmup_enabled=os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+            max_batch_size=_env_int("MAX_BATCH_SIZE", 4),
+            batch_wait_ms=_env_float("BATCH_WAIT_MS", 0.0),
+            max_session_duration=_env_int("MAX_SESSION_DURATION", 3600),
+            max_buffer_size=_env_int("MAX_BUFFER_SIZE", 160000),
+            warmup_enabled=_env_bool("WARMUP_ENABLED", True),
+            fp16=_env_bool("ASR_FP16", False)
         )
 
         return cls(
@@ -114,28 +236,11 @@ class Config:
         )
 
     def to_dict(self) -> dict:
-        """Convert config to dictionary"""
-        return {
-            'model': {
-                'model_name': self.model.model_name,
-                'device': self.model.device,
-                'cache_dir': self.model.cache_dir
-            },
-            'audio': {
-                'sample_rate': self.audio.sample_rate,
-                'chunk_duration': self.audio.chunk_duration,
-                'left_context_duration': self.audio.left_context_duration,
-                'right_context_duration': self.audio.right_context_duration
-            },
-            'endpointing': {
-                'strategy': self.endpointing.strategy,
-                'energy_threshold': self.endpointing.energy_threshold,
-                'silence_duration': self.endpointing.silence_duration,
-                'vad_enabled': self.endpointing.vad_enabled
-            },
-            'performance': {
-                'max_session_duration': self.performance.max_session_duration,
-                'max_buffer_size': self.performance.max_buffer_size,
-                'warmup_enabled': self.performance.warmup_enabled
-            }
-        }
+        """Convert config to dictionary (every field, nested by section)"""
+        return asdict(self)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(cls, config_file, mtime, env) -> Config:
+    """Memoized Config._load; mtime and env only serve as cache key"""
+    return cls._load(config_file)
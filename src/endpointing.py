@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import time
 import logging
@@ -5,8 +6,30 @@ from typing import Optional
 
 from src.config import EndpointingConfig
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
+# NeMo is slow to import, so it is loaded on first use by _import_nemo_asr()
+nemo_asr = None
+
 logger = logging.getLogger(__name__)
 
+# Multiples of energy_threshold outside which a chunk is classified by energy
+# alone when using VAD (clearly silent / clearly speech)
+VAD_SILENCE_GATE = 0.5
+VAD_SPEECH_GATE = 3.0
+
+
+def _import_nemo_asr():
+    """Import the NeMo ASR collection once and cache it on the module"""
+    global nemo_asr
+    if nemo_asr is None:
+        import nemo.collections.asr as nemo_asr_module
+        nemo_asr = nemo_asr_module
+    return nemo_asr
+
 
 class Endpointing:
     """
@@ -20,13 +43,30 @@ class Endpointing:
         self.config = config
         self.strategy = config.strategy
 
+        # Thresholds read on every chunk, cached as plain attributes
+        self._energy_threshold = config.energy_threshold
+        self._silence_duration_ns = int(config.silence_duration * 1e9)
+        self._vad_threshold = config.vad_threshold
+
+        # Compare squared energy against squared threshold to skip the sqrt
+        self._energy_threshold_sq = config.energy_threshold ** 2
+
+        # Energy gate for VAD: below/above these levels the VAD model is skipped
+        self._vad_silence_energy_sq = (VAD_SILENCE_GATE * self._energy_threshold) ** 2
+        self._vad_speech_energy_sq = (VAD_SPEECH_GATE * self._energy_threshold) ** 2
+
         # State tracking
-        self.silence_start: Optional[float] = None
+        self.silence_start: Optional[int] = None  # time.monotonic_ns()
         self.speech_detected = False
 
         # VAD model (loaded on demand)
         self.vad_model = None
 
+        # Reusable VAD input tensors, grown on demand by _stage_vad_input()
+        self._vad_device = None
+        self._vad_input = None  # [1, capacity] on the VAD device
+        self._vad_host = None  # Pinned [1, capacity] staging tensor (CUDA only)
+
         # Load VAD if requested
         if config.strategy == "vad" and config.vad_enabled:
             self._load_vad_model()
@@ -36,13 +76,22 @@ class Endpointing:
     def _load_vad_model(self):
         """Load VAD model (MarbleNet)"""
         try:
-            import nemo.collections.asr as nemo_asr
+            asr_models = _import_nemo_asr().models
 
             logger.info("Loading VAD model (MarbleNet)...")
-            self.vad_model = nemo_asr.models.EncDecClassificationModel.from_pretrained(
+            self.vad_model = asr_models.EncDecClassificationModel.from_pretrained(
                 model_name="nvidia/vad_multilingual_marblenet"
             )
             self.vad_model.eval()
+            self._vad_device = torch.device(getattr(self.vad_model, 'device', 'cpu'))
+
+            # Speech/background classification is robust to reduced precision;
+            # only the weights are cast, the waveform input stays float32 and
+            # the preprocessor keeps computing features in float32
+            if self._vad_device.type == "cuda":
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self.vad_model = self.vad_model.to(dtype)
+                logger.info(f"VAD running in {dtype}")
             logger.info("VAD model loaded successfully")
 
         except Exception as e:
@@ -81,106 +130,149 @@ class Endpointing:
         Returns:
             True if endpoint detected
         """
-        # Calculate RMS energy
-        rms = np.sqrt(np.mean(audio ** 2))
-
-        # Check if below silence threshold
-        if rms < self.config.energy_threshold:
-            # Silence detected
-            if self.silence_start is None:
-                # Start tracking silence
-                self.silence_start = time.time()
-                logger.debug(f"Silence started (RMS: {rms:.6f})")
-            else:
-                # Check if silence duration exceeds threshold
-                silence_duration = time.time() - self.silence_start
-                if silence_duration >= self.config.silence_duration:
-                    # Long enough silence, trigger endpoint
-                    logger.debug(
-                        f"Endpoint detected after {silence_duration:.2f}s of silence"
-                    )
-                    self.silence_start = None
-                    self.speech_detected = False
-                    return True
-        else:
-            # Speech detected, reset silence tracking
-            if self.silence_start is not None:
-                silence_duration = time.time() - self.silence_start
-                logger.debug(
-                    f"Speech resumed after {silence_duration:.2f}s of silence "
-                    f"(RMS: {rms:.6f})"
-                )
-            self.silence_start = None
-            self.speech_detected = True
-
-        return False
+        energy, n = self._energy(audio)
+        return self._update_silence(
+            energy < self._energy_threshold_sq * n, "RMS", energy, n
+        )
 
     def _vad_based_endpoint(self, audio: np.ndarray) -> bool:
         """
         VAD model-based endpoint detection.
 
+        Chunks that are clearly silent or clearly loud by energy alone are
+        decided without running the VAD model; only the ambiguous band
+        around the energy threshold goes through MarbleNet.
+
         Args:
             audio: Audio chunk as numpy array
 
         Returns:
             True if endpoint detected
         """
-        if self.vad_model is None:
+        if self.vad_model is None or torch is None:
             # Fallback to energy-based
             return self._energy_based_endpoint(audio)
 
-        try:
-            import torch
-
-            # Convert to tensor
-            audio_tensor = torch.from_numpy(audio).unsqueeze(0)  # [1, samples]
-
-            # Move to same device as model
-            if hasattr(self.vad_model, 'device'):
-                audio_tensor = audio_tensor.to(self.vad_model.device)
+        # Energy gate
+        energy, n = self._energy(audio)
+        if energy < self._vad_silence_energy_sq * n:
+            return self._update_silence(True, "RMS", energy, n)
+        if energy > self._vad_speech_energy_sq * n:
+            return self._update_silence(False, "RMS", energy, n)
 
+        try:
             # Run VAD inference
-            with torch.no_grad():
+            with torch.inference_mode():
+                audio_tensor = self._stage_vad_input(audio)  # [1, samples]
                 logits = self.vad_model(audio_tensor)
                 # logits shape: [batch, time, classes] where classes = [background, speech]
-                probs = torch.softmax(logits, dim=-1)
+                # With two classes, softmax(logits)[..., 1] == sigmoid(speech - background),
+                # so a single sigmoid over the logit difference replaces the softmax
+                frame_logits = logits[0].float()
+                logit_diff = frame_logits[:, 1] - frame_logits[:, 0]
 
                 # Average speech probability across time
-                speech_prob = probs[0, :, 1].mean().item()
-
-            # Check if speech probability is below threshold (i.e., silence/background)
-            if speech_prob < self.config.vad_threshold:
-                # Silence/background detected
-                if self.silence_start is None:
-                    self.silence_start = time.time()
-                    logger.debug(f"Silence started (VAD: {speech_prob:.3f})")
-                else:
-                    silence_duration = time.time() - self.silence_start
-                    if silence_duration >= self.config.silence_duration:
-                        logger.debug(
-                            f"Endpoint detected after {silence_duration:.2f}s "
-                            f"(VAD: {speech_prob:.3f})"
-                        )
-                        self.silence_start = None
-                        self.speech_detected = False
-                        return True
-            else:
-                # Speech detected
-                if self.silence_start is not None:
-                    silence_duration = time.time() - self.silence_start
-                    logger.debug(
-                        f"Speech resumed after {silence_duration:.2f}s "
-                        f"(VAD: {speech_prob:.3f})"
-                    )
-                self.silence_start = None
-                self.speech_detected = True
-
-            return False
+                speech_prob = torch.sigmoid(logit_diff).mean().item()
 
         except Exception as e:
             logger.warning(f"VAD inference failed: {e}, falling back to energy-based")
             return self._energy_based_endpoint(audio)
 
+        # Speech probability below threshold means silence/background
+        return self._update_silence(speech_prob < self._vad_threshold, "VAD", speech_prob)
+
+    def _stage_vad_input(self, audio: np.ndarray):
+        """
+        Copy a chunk into the preallocated VAD input tensor.
+
+        The tensors are reallocated only when a longer chunk arrives; on CUDA
+        the chunk goes through a pinned host tensor so the device copy can be
+        non-blocking. Reading the speech probability synchronizes before the
+        next chunk reuses the buffers.
+
+        Args:
+            audio: Audio chunk as numpy array
+
+        Returns:
+            [1, samples] float32 tensor on the VAD model's device
+        """
+        n = audio.shape[0]
+
+        if self._vad_input is None or self._vad_input.shape[1] < n:
+            self._vad_input = torch.empty((1, n), dtype=torch.float32, device=self._vad_device)
+            if self._vad_device.type == "cuda":
+                self._vad_host = torch.empty((1, n), dtype=torch.float32, pin_memory=True)
+
+        if self._vad_host is None:
+            self._vad_input.numpy()[0, :n] = audio
+        else:
+            self._vad_host.numpy()[0, :n] = audio
+            self._vad_input[:, :n].copy_(self._vad_host[:, :n], non_blocking=True)
+
+        return self._vad_input[:, :n]
+
+    @staticmethod
+    def _energy(audio: np.ndarray):
+        """
+        Sum of squares of a chunk in a single pass (no squared temporary).
+
+        rms < threshold  <=>  sum(x^2) < threshold^2 * n
+
+        Returns:
+            Tuple of (sum of squares, number of samples)
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        return float(np.dot(audio, audio)), audio.size
+
+    def _update_silence(self, is_silence: bool, measure: str, value: float, n: int = 0) -> bool:
+        """
+        Advance silence tracking with the decision for one chunk.
+
+        Args:
+            is_silence: Whether the chunk was classified as silence
+            measure: Name of the measurement for debug logs ("RMS" or "VAD")
+            value: Speech probability for VAD, sum of squares for RMS
+            n: Number of samples (RMS only)
+
+        Returns:
+            True if endpoint detected
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug and measure == "RMS":
+            value = math.sqrt(value / max(n, 1))
+
+        if is_silence:
+            if self.silence_start is None:
+                # Start tracking silence
+                self.silence_start = time.monotonic_ns()
+                if debug:
+                    logger.debug(f"Silence started ({measure}: {value:.6f})")
+            else:
+                # Check if silence duration exceeds threshold
+                elapsed_ns = time.monotonic_ns() - self.silence_start
+                if elapsed_ns >= self._silence_duration_ns:
+                    # Long enough silence, trigger endpoint
+                    if debug:
+                        logger.debug(
+                            f"Endpoint detected after {elapsed_ns * 1e-9:.2f}s of silence "
+                            f"({measure}: {value:.6f})"
+                        )
+                    self.silence_start = None
+                    self.speech_detected = False
+                    return True
+        else:
+            # Speech detected, reset silence tracking
+            if self.silence_start is not None and debug:
+                silence_duration = (time.monotonic_ns() - self.silence_start) * 1e-9
+                logger.debug(
+                    f"Speech resumed after {silence_duration:.2f}s of silence "
+                    f"({measure}: {value:.6f})"
+                )
+            self.silence_start = None
+            self.speech_detected = True
+
+        return False
+
     def reset(self):
         """Reset endpointing state"""
         self.silence_start = None
@@ -200,7 +292,7 @@ class Endpointing:
         """
         if self.silence_start is None:
             return 0.0
-        return time.time() - self.silence_start
+        return (time.monotonic_ns() - self.silence_start) * 1e-9
 
     def get_stats(self) -> dict:
         """Get endpointing statistics"""
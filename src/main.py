@@ -1,9 +1,14 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 import logging
-import uuid
+import secrets
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used without it
+    orjson = None
 
 from src.session import SessionManager, SessionState
 from src.config import Config
@@ -15,6 +20,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Control message decoder (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
 app = FastAPI(title="Real-Time Transcription Service")
 
 # Global state for ASR engine and config
@@ -23,6 +32,18 @@ asr_engine_instance = None
 session_manager = None
 
 
+def _json_dumps(message: Dict[str, Any]) -> str:
+    """Encode a server message as compact JSON text"""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+async def send_message(websocket: WebSocket, message: Dict[str, Any]):
+    """Send a server message as a JSON text frame (orjson when available)"""
+    await websocket.send_text(_json_dumps(message))
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize ASR engine on startup"""
@@ -96,11 +117,23 @@ async def health():
 
 @app.websocket("/ws/transcribe")
 async def websocket_transcribe(websocket: WebSocket):
+    """
+    Streaming transcription endpoint.
+
+    Protocol:
+        - Binary frames carry raw PCM audio (16-bit little-endian, mono) and
+          are passed to the session without any decoding step
+        - Text frames carry JSON control messages: {"type": "start"} and
+          {"type": "stop"}
+        - Server messages are JSON text frames (session_started,
+          streaming_started, partial_transcript, final_transcript,
+          streaming_stopped, error)
+    """
     await websocket.accept()
 
     # Check if ASR is available
     if not getattr(app.state, "asr_ready", False):
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "error",
             "message": "ASR service unavailable",
             "details": getattr(app.state, "asr_error", "Service not initialized"),
@@ -109,16 +142,16 @@ async def websocket_transcribe(websocket: WebSocket):
         await websocket.close()
         return
 
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_hex(16)
     session = None
 
     try:
         session = await session_manager.create_session(session_id)
 
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "session_started",
             "session_id": session_id,
-            "state": session.get_state().value
+            "state": session.state
         })
 
         logger.info(f"WebSocket connected: session {session_id}")
@@ -128,7 +161,7 @@ async def websocket_transcribe(websocket: WebSocket):
                 data = await websocket.receive()
 
                 if "text" in data:
-                    message = json.loads(data["text"])
+                    message = _json_loads(data["text"])
                     await handle_text_message(websocket, session, message)
 
                 elif "bytes" in data:
@@ -139,13 +172,13 @@ async def websocket_transcribe(websocket: WebSocket):
                 break
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON: {e}")
-                await websocket.send_json({
+                await send_message(websocket, {
                     "type": "error",
                     "message": "Invalid JSON format"
                 })
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
-                await websocket.send_json({
+                await send_message(websocket, {
                     "type": "error",
                     "message": str(e)
                 })
@@ -153,7 +186,7 @@ async def websocket_transcribe(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
-            await websocket.send_json({
+            await send_message(websocket, {
                 "type": "error",
                 "message": "Internal server error"
             })
@@ -170,57 +203,93 @@ async def websocket_transcribe(websocket: WebSocket):
         logger.info(f"Session {session_id} cleanup complete")
 
 
-async def handle_text_message(websocket: WebSocket, session, message: Dict[str, Any]):
-    msg_type = message.get("type")
+async def handle_start(websocket: WebSocket, session):
+    """Handle a "start" control message"""
+    if session.state is SessionState.INIT:
+        await session.start_streaming()
+        await send_message(websocket, {
+            "type": "streaming_started",
+            "session_id": session.session_id,
+            "state": session.state
+        })
+    else:
+        await send_message(websocket, {
+            "type": "error",
+            "message": f"Cannot start from state {session.get_state().value}"
+        })
 
-    if msg_type == "start":
-        if session.get_state() == SessionState.INIT:
-            await session.start_streaming()
-            await websocket.send_json({
-                "type": "streaming_started",
-                "session_id": session.session_id,
-                "state": session.get_state().value
-            })
-        else:
-            await websocket.send_json({
-                "type": "error",
-                "message": f"Cannot start from state {session.get_state().value}"
-            })
 
-    elif msg_type == "stop":
-        await session.finalize()
+async def handle_stop(websocket: WebSocket, session):
+    """Handle a "stop" control message"""
+    await session.finalize()
 
-        # Get final transcript
-        final_transcript = session.get_final_transcript()
+    # Get final transcript
+    final_transcript = session.get_final_transcript()
 
-        await websocket.send_json({
-            "type": "streaming_stopped",
-            "session_id": session.session_id,
-            "state": session.get_state().value,
-            "final_transcript": final_transcript
-        })
-        await session.close()
+    await send_message(websocket, {
+        "type": "streaming_stopped",
+        "session_id": session.session_id,
+        "state": session.state,
+        "final_transcript": final_transcript
+    })
+    await session.close()
 
-    else:
-        await websocket.send_json({
+
+# Control message type -> handler
+CONTROL_HANDLERS = {
+    "start": handle_start,
+    "stop": handle_stop,
+}
+
+
+async def handle_text_message(websocket: WebSocket, session, message: Dict[str, Any]):
+    msg_type = message.get("type")
+
+    handler = CONTROL_HANDLERS.get(msg_type)
+    if handler is None:
+        await send_message(websocket, {
             "type": "error",
             "message": f"Unknown message type: {msg_type}"
         })
+        return
+
+    await handler(websocket, session)
+
+
+def coalesce_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop partial transcripts superseded within the same batch of results.
+
+    A partial is replaced by whatever result follows it, so only a trailing
+    partial is still current. Final transcripts are always kept, in order.
+
+    Args:
+        results: Results from one add_audio_chunk call
+
+    Returns:
+        Results to send to the client
+    """
+    last = len(results) - 1
+    return [
+        result for i, result in enumerate(results)
+        if not result["is_partial"] or i == last
+    ]
 
 
 async def handle_audio_data(websocket: WebSocket, session, audio_bytes: bytes):
     """Process audio data and send transcription results"""
-    if session.get_state() != SessionState.STREAMING:
-        logger.warning(f"Received audio in state {session.get_state()}, ignoring")
+    state = session.state
+    if state is not SessionState.STREAMING:
+        logger.warning(f"Received audio in state {state}, ignoring")
         return
 
     try:
         # Process audio and get transcription results
         results = await session.add_audio_chunk(audio_bytes)
 
-        # Send all transcript results to client
-        for result in results:
-            await websocket.send_json(result)
+        # Send transcript results to client
+        for result in coalesce_results(results):
+            await send_message(websocket, result)
 
         # Debug logging
         if results:
@@ -229,14 +298,14 @@ async def handle_audio_data(websocket: WebSocket, session, audio_bytes: bytes):
     except RuntimeError as e:
         # ASR-specific errors (model not loaded, GPU OOM, etc.)
         logger.error(f"ASR error: {e}")
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "error",
             "message": "ASR processing error",
             "details": str(e)
         })
     except Exception as e:
         logger.error(f"Error handling audio: {e}", exc_info=True)
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "error",
             "message": "Error processing audio"
         })
@@ -1,16 +1,18 @@
 from enum import Enum
 from typing import Optional, List, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 import logging
+import time
 
-from src.audio_processor import AudioProcessor
+from src.audio_processor import AudioProcessor, AudioRingBuffer
+from src.config import PerformanceConfig
 from src.endpointing import Endpointing
 
 logger = logging.getLogger(__name__)
 
 
-class SessionState(Enum):
+class SessionState(str, Enum):
     INIT = "init"
     STREAMING = "streaming"
     FINALIZING = "finalizing"
@@ -18,11 +20,19 @@ class SessionState(Enum):
 
 
 class TranscriptionSession:
+    __slots__ = (
+        "session_id", "state", "created_at_ns", "created_at_wall", "_lock_instance",
+        "asr_engine", "config", "audio_processor", "endpointing", "audio_buffer",
+        "current_partial", "final_transcripts", "_final_transcript", "transcript_parts",
+        "__weakref__",
+    )
+
     def __init__(self, session_id: str, asr_engine=None, config=None):
         self.session_id = session_id
         self.state = SessionState.INIT
-        self.created_at = datetime.utcnow()
-        self._lock = asyncio.Lock()
+        self.created_at_ns = time.monotonic_ns()  # For session age
+        self.created_at_wall = time.time()  # For reporting only
+        self._lock_instance: Optional[asyncio.Lock] = None  # See _lock
 
         # ASR components (optional for backward compatibility)
         self.asr_engine = asr_engine
@@ -37,17 +47,27 @@ class TranscriptionSession:
             self.audio_processor = None
             self.endpointing = None
 
-        # Legacy buffer (kept for backward compatibility)
-        self.audio_buffer = bytearray()
+        # Legacy buffer (kept for backward compatibility): the most recent
+        # max_buffer_size samples of raw audio
+        performance = config.performance if config else PerformanceConfig()
+        self.audio_buffer = AudioRingBuffer(performance.max_buffer_size)
 
         # Transcription state
         self.current_partial = ""
         self.final_transcripts = []
+        self._final_transcript: Optional[str] = None  # Cached join, see get_final_transcript
         self.transcript_parts = []  # Legacy field
 
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """State transition lock, created on first use"""
+        if self._lock_instance is None:
+            self._lock_instance = asyncio.Lock()
+        return self._lock_instance
+
     async def start_streaming(self):
         async with self._lock:
-            if self.state != SessionState.INIT:
+            if self.state is not SessionState.INIT:
                 raise ValueError(f"Cannot start streaming from state {self.state}")
             self.state = SessionState.STREAMING
             logger.info(f"Session {self.session_id}: INIT -> STREAMING")
@@ -60,78 +80,110 @@ class TranscriptionSession:
         """
         Process audio chunk and return transcription results.
 
+        Not locked: each session's audio arrives in order from a single
+        websocket handler, so only state transitions take the lock.
+
         Args:
             audio_data: Raw PCM audio bytes
 
         Returns:
             List of result dictionaries with type, text, is_partial fields
         """
-        async with self._lock:
-            if self.state != SessionState.STREAMING:
-                raise ValueError(f"Cannot add audio in state {self.state}")
-
-            # Legacy behavior - update buffer
-            self.audio_buffer.extend(audio_data)
-
-            # If no ASR components, return empty results
-            if not self.audio_processor or not self.asr_engine:
-                return []
-
-            results = []
-
-            try:
-                # Add audio to processor
-                self.audio_processor.add_audio(audio_data)
-
-                # Get chunks ready for inference
-                chunks = self.audio_processor.get_inference_chunks()
-
-                for chunk in chunks:
-                    # Transcribe chunk
-                    transcript_result = await self.asr_engine.transcribe_chunk(chunk)
-
-                    # Check for endpoint
-                    is_endpoint = self.endpointing.process_audio(chunk)
-
-                    if is_endpoint:
-                        # Finalize current utterance
-                        if self.current_partial:
-                            self.final_transcripts.append(self.current_partial)
-                            results.append({
-                                "type": "final_transcript",
-                                "text": self.current_partial,
-                                "is_partial": False
-                            })
-                            logger.debug(
-                                f"Finalized transcript: {self.current_partial[:50]}..."
-                            )
-
-                        # Start new utterance
-                        self.current_partial = transcript_result["text"]
-                        self.endpointing.reset()
-
-                    else:
-                        # Update partial transcript
-                        self.current_partial = transcript_result["text"]
+        if self.state is not SessionState.STREAMING:
+            raise ValueError(f"Cannot add audio in state {self.state}")
+
+        # Legacy behavior - update buffer
+        self.audio_buffer.write(audio_data)
+
+        # If no ASR components, return empty results
+        if not self.audio_processor or not self.asr_engine:
+            return []
+
+        results = []
+
+        try:
+            # Add audio to processor
+            self.audio_processor.add_audio(audio_data)
+
+            # Get chunks ready for inference
+            chunks = self.audio_processor.get_inference_chunks()
+            if not chunks:
+                return results
+
+            # Endpointing is cheap, so decide every chunk first and only
+            # transcribe the ones that may contain speech: an endpoint chunk
+            # closes the utterance and a chunk inside a silence run would
+            # only repeat the current partial
+            decisions = []
+            speech_chunks = []
+            for chunk in chunks:
+                is_endpoint = self.endpointing.process_audio(chunk)
+                if is_endpoint:
+                    self.endpointing.reset()
+                needs_asr = not is_endpoint and not self.endpointing.is_in_silence()
+                decisions.append((is_endpoint, needs_asr))
+                if needs_asr:
+                    speech_chunks.append(chunk)
+
+            transcript_results = []
+            if speech_chunks:
+                # Transcribe all speech chunks in batched model calls. The
+                # chunks are views into the audio processor's context buffer,
+                # read later on the ASR executor thread; they stay valid only
+                # because this session's frames are handled sequentially and
+                # the next get_inference_chunks() waits for this await
+                transcript_results = await self.asr_engine.transcribe_batch(speech_chunks)
+
+                # The session may have been finalized or closed while awaiting
+                # inference; its transcript is settled, so drop late results
+                if self.state is not SessionState.STREAMING:
+                    logger.debug(
+                        f"Session {self.session_id}: dropping results received "
+                        f"in state {self.state.value}"
+                    )
+                    return results
+
+            transcripts = iter(transcript_results)
+            for is_endpoint, needs_asr in decisions:
+                if is_endpoint:
+                    # Finalize current utterance
+                    if self.current_partial:
+                        self._add_final_transcript(self.current_partial)
                         results.append({
-                            "type": "partial_transcript",
-                            "text": transcript_result["text"],
-                            "is_partial": True
+                            "type": "final_transcript",
+                            "text": self.current_partial,
+                            "is_partial": False
                         })
+                        logger.debug(
+                            f"Finalized transcript: {self.current_partial[:50]}..."
+                        )
+
+                    # Start new utterance
+                    self.current_partial = ""
 
-            except Exception as e:
-                logger.error(f"Error processing audio chunk: {e}", exc_info=True)
-                raise
+                elif needs_asr:
+                    # Update partial transcript
+                    text = next(transcripts)["text"]
+                    self.current_partial = text
+                    results.append({
+                        "type": "partial_transcript",
+                        "text": text,
+                        "is_partial": True
+                    })
 
-            return results
+        except Exception as e:
+            logger.error(f"Error processing audio chunk: {e}", exc_info=True)
+            raise
+
+        return results
 
     async def finalize(self):
         """Finalize the session and flush any remaining audio"""
         async with self._lock:
-            if self.state == SessionState.CLOSED:
+            if self.state is SessionState.CLOSED:
                 return
 
-            if self.state == SessionState.STREAMING:
+            if self.state is SessionState.STREAMING:
                 self.state = SessionState.FINALIZING
                 logger.info(f"Session {self.session_id}: STREAMING -> FINALIZING")
 
@@ -149,7 +201,7 @@ class TranscriptionSession:
 
                 # Finalize current partial if exists
                 if self.current_partial:
-                    self.final_transcripts.append(self.current_partial)
+                    self._add_final_transcript(self.current_partial)
                     logger.info(f"Final transcript: {self.current_partial}")
 
     async def close(self):
@@ -168,16 +220,24 @@ class TranscriptionSession:
     def get_state(self) -> SessionState:
         return self.state
 
+    def _add_final_transcript(self, text: str):
+        """Append a finalized utterance and invalidate the joined transcript"""
+        self.final_transcripts.append(text)
+        self._final_transcript = None
+
     def get_final_transcript(self) -> str:
         """Get the complete final transcript"""
-        return " ".join(self.final_transcripts)
+        if self._final_transcript is None:
+            self._final_transcript = " ".join(self.final_transcripts)
+        return self._final_transcript
 
     def get_stats(self) -> Dict:
         """Get session statistics"""
         stats = {
             "session_id": self.session_id,
             "state": self.state.value,
-            "created_at": self.created_at.isoformat(),
+            "created_at": datetime.fromtimestamp(self.created_at_wall, timezone.utc).isoformat(),
+            "age_seconds": (time.monotonic_ns() - self.created_at_ns) * 1e-9,
             "final_transcripts_count": len(self.final_transcripts),
             "has_asr": self.asr_engine is not None
         }
@@ -192,11 +252,20 @@ class TranscriptionSession:
 
 
 class SessionManager:
+    __slots__ = ("sessions", "asr_engine", "config", "_lock_instance", "__weakref__")
+
     def __init__(self, asr_engine=None, config=None):
         self.sessions: dict[str, TranscriptionSession] = {}
         self.asr_engine = asr_engine
         self.config = config
-        self._lock = asyncio.Lock()
+        self._lock_instance: Optional[asyncio.Lock] = None  # See _lock
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """Session table lock, created on first use"""
+        if self._lock_instance is None:
+            self._lock_instance = asyncio.Lock()
+        return self._lock_instance
 
     async def create_session(self, session_id: str) -> TranscriptionSession:
         async with self._lock:
@@ -215,8 +284,8 @@ class SessionManager:
             return session
 
     async def get_session(self, session_id: str) -> Optional[TranscriptionSession]:
-        async with self._lock:
-            return self.sessions.get(session_id)
+        # Single dict read, no lock needed
+        return self.sessions.get(session_id)
 
     async def close_session(self, session_id: str):
         async with self._lock:
@@ -3,7 +3,7 @@ import asyncio
 import numpy as np
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from src.asr_engine import ASREngine, PerformanceMetrics
-from src.config import Config, ModelConfig
+from src.config import Config, ModelConfig, PerformanceConfig
 
 
 @pytest.fixture
@@ -18,7 +18,8 @@ async def engine():
     # Reset singleton
     ASREngine._instance = None
     engine = await ASREngine.get_instance()
-    return engine
+    yield engine
+    await engine.cleanup()
 
 
 @pytest.mark.asyncio
@@ -50,6 +51,18 @@ def test_performance_metrics():
     assert 'average_rtf' in stats
 
 
+def test_performance_metrics_rolling_window():
+    """Test average RTF only covers the most recent measurements"""
+    metrics = PerformanceMetrics(history_size=3)
+
+    for inference_time in (0.9, 0.1, 0.2, 0.3):
+        metrics.record_inference(audio_duration=1.0, inference_time=inference_time)
+
+    assert len(metrics.rtf_history) == 3
+    assert metrics.average_rtf == pytest.approx(0.2)
+    assert metrics.overall_rtf == pytest.approx(0.375)
+
+
 @pytest.mark.asyncio
 async def test_device_detection_cpu(engine, config):
     """Test device detection defaults to CPU without torch"""
@@ -66,7 +79,7 @@ async def test_device_detection_cuda_available(engine, config):
     mock_torch.cuda.get_device_name.return_value = "Tesla T4"
     mock_torch.cuda.get_device_properties.return_value = Mock(total_memory=16e9)
 
-    with patch.dict('sys.modules', {'torch': mock_torch}):
+    with patch('src.asr_engine.torch', mock_torch):
         device = engine._detect_device(config)
         assert device == "cuda"
 
@@ -78,10 +91,9 @@ async def test_device_detection_cuda_not_available(engine):
     mock_torch.cuda.is_available.return_value = False
 
     # Config with device="auto"
-    config = Config()
-    config.model.device = "auto"
+    config = Config(model=ModelConfig(device="auto"))
 
-    with patch.dict('sys.modules', {'torch': mock_torch}):
+    with patch('src.asr_engine.torch', mock_torch):
         device = engine._detect_device(config)
         assert device == "cpu"
 
@@ -93,10 +105,9 @@ async def test_device_detection_cuda_required_but_unavailable(engine):
     mock_torch.cuda.is_available.return_value = False
 
     # Config with device="cuda" (required)
-    config = Config()
-    config.model.device = "cuda"
+    config = Config(model=ModelConfig(device="cuda"))
 
-    with patch.dict('sys.modules', {'torch': mock_torch}):
+    with patch('src.asr_engine.torch', mock_torch):
         with pytest.raises(RuntimeError, match="CUDA device requested but not available"):
             engine._detect_device(config)
 
@@ -104,7 +115,8 @@ async def test_device_detection_cuda_required_but_unavailable(engine):
 @pytest.mark.asyncio
 async def test_load_model_nemo_not_installed(engine, config):
     """Test graceful error when NeMo not installed"""
-    with patch('src.asr_engine.nemo_asr', side_effect=ImportError("No module named 'nemo'")):
+    with patch('src.asr_engine.nemo_asr', None), \
+            patch.dict('sys.modules', {'nemo.collections.asr': None}):
         with pytest.raises(RuntimeError, match="NeMo toolkit not installed"):
             await engine.load_model(config)
 
@@ -118,6 +130,83 @@ async def test_transcribe_without_loaded_model(engine):
         await engine.transcribe_chunk(audio)
 
 
+@pytest.mark.asyncio
+async def test_transcribe_batch_groups_chunks(engine):
+    """Test that ready chunks are transcribed in groups of max_batch_size"""
+    config = Config(performance=PerformanceConfig(max_batch_size=2))
+    engine.config = config
+    engine.sample_rate = 16000
+    engine._cache_settings()
+    engine.is_loaded = True
+    infer = Mock(side_effect=lambda batch: [f"text {len(a)}" for a in batch])
+
+    audios = [np.zeros(16000 * (i + 1), dtype=np.float32) for i in range(3)]
+
+    with patch.object(engine, '_infer', infer):
+        results = await engine.transcribe_batch(audios)
+
+    assert [r['text'] for r in results] == ["text 16000", "text 32000", "text 48000"]
+    assert all(r['is_partial'] for r in results)
+    assert infer.call_count == 2
+    assert engine.metrics.inference_count == 2
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batch_coalesces_sessions(engine):
+    """Test that chunks queued by concurrent callers share one model call"""
+    engine.config = Config(performance=PerformanceConfig(max_batch_size=4))
+    engine.sample_rate = 16000
+    engine._cache_settings()
+    engine.is_loaded = True
+    infer = Mock(side_effect=lambda batch: [f"text {len(a)}" for a in batch])
+
+    first = [np.zeros(16000, dtype=np.float32)]
+    second = [np.zeros(32000, dtype=np.float32), np.zeros(48000, dtype=np.float32)]
+
+    with patch.object(engine, '_infer', infer):
+        results = await asyncio.gather(
+            engine.transcribe_batch(first),
+            engine.transcribe_batch(second)
+        )
+
+    assert [r['text'] for r in results[0]] == ["text 16000"]
+    assert [r['text'] for r in results[1]] == ["text 32000", "text 48000"]
+    assert infer.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batch_inference_error(engine):
+    """Test that model failures reach every caller as RuntimeError"""
+    engine.config = Config()
+    engine.sample_rate = 16000
+    engine._cache_settings()
+    engine.is_loaded = True
+
+    with patch.object(engine, '_infer', Mock(side_effect=ValueError("bad input"))):
+        with pytest.raises(RuntimeError, match="Transcription error: bad input"):
+            await engine.transcribe_batch([np.zeros(16000, dtype=np.float32)])
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batch_scheduler_failure(engine):
+    """Test that queued callers are failed if the scheduler task dies"""
+    engine.config = Config()
+    engine.sample_rate = 16000
+    engine._cache_settings()
+    engine.is_loaded = True
+
+    async def broken_scheduler():
+        raise ValueError("scheduler bug")
+
+    with patch.object(engine, '_run_scheduler', broken_scheduler):
+        with pytest.raises(RuntimeError, match="scheduler bug"):
+            await asyncio.wait_for(
+                engine.transcribe_batch([np.zeros(16000, dtype=np.float32)]), 1.0
+            )
+
+    assert not engine._pending
+
+
 @pytest.mark.asyncio
 async def test_get_stats(engine):
     """Test getting engine statistics"""
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from src.audio_processor import AudioProcessor
+from src.audio_processor import AudioProcessor, AudioRingBuffer
 from src.config import AudioConfig
 
 
@@ -114,6 +114,17 @@ def test_bytes_to_audio_conversion(processor):
     assert audio_float[4] == pytest.approx(-1.0, abs=1e-3)
 
 
+def test_bytes_to_audio_into_preallocated_buffer(processor):
+    """Test conversion writes into a caller-provided buffer"""
+    audio_int16 = np.array([0, 16384, -16384, -32768], dtype=np.int16)
+    out = np.empty(4, dtype=np.float32)
+
+    audio_float = processor._bytes_to_audio(audio_int16.tobytes(), out=out)
+
+    assert audio_float is out
+    np.testing.assert_array_equal(out, [0.0, 0.5, -0.5, -1.0])
+
+
 def test_flush_remaining_audio(processor):
     """Test flushing remaining audio from buffer"""
     # Add less than 1 chunk
@@ -147,7 +158,7 @@ def test_reset(processor):
     processor.reset()
 
     assert len(processor.buffer) == 0
-    assert len(processor.left_context_buffer) == 0
+    assert processor.get_stats()['left_context_chunks'] == 0
     assert processor.total_bytes_processed == 0
     assert processor.chunks_processed == 0
 
@@ -200,5 +211,75 @@ def test_long_context_accumulation(processor):
     assert chunks[0].shape[0] <= 176000  # 11 seconds at 16kHz
 
 
+def test_context_window_contents(processor):
+    """Test that inference input is the most recent context followed by the chunk"""
+    chunks_int16 = [
+        np.full(16000, i * 1000, dtype=np.int16) for i in range(1, 13)
+    ]
+    for chunk in chunks_int16:
+        processor.add_audio(chunk.tobytes())
+        result = processor.get_inference_chunks()
+
+    # 12 chunks seen: the last 10 before the final chunk are kept as context
+    expected = np.concatenate(chunks_int16[1:]).astype(np.float32) / 32768.0
+    assert result[0].shape[0] == 176000
+    np.testing.assert_array_equal(result[0], expected)
+
+
+def test_windows_survive_compaction(processor):
+    """Test that windows stay intact when the context buffer compacts or grows"""
+    audio = (np.arange(16000 * 40) % 30000).astype(np.int16)
+    expected = audio / 32768.0
+
+    # One chunk per call compacts the buffer every few chunks
+    end = 0
+    for i in range(20):
+        processor.add_audio(audio[end:end + 16000].tobytes())
+        end += 16000
+        result = processor.get_inference_chunks()
+        np.testing.assert_array_equal(result[0], expected[max(0, end - 176000):end])
+
+    # A burst larger than the buffer grows it; every window in the call holds
+    processor.add_audio(audio[end:].tobytes())
+    chunks = processor.get_inference_chunks()
+    assert len(chunks) == 20
+    for chunk in chunks:
+        end += 16000
+        np.testing.assert_array_equal(chunk, expected[end - 176000:end])
+
+
+def test_ring_buffer_wraps_and_keeps_latest():
+    """Test ring buffer keeps the most recent samples across wrap-around"""
+    ring = AudioRingBuffer(capacity=10)
+
+    ring.write(np.arange(6, dtype=np.int16).tobytes())
+    assert len(ring) == 6
+    np.testing.assert_array_equal(ring.get_window(), np.arange(6))
+
+    ring.write(np.arange(6, 13, dtype=np.int16).tobytes())
+    assert len(ring) == 10
+    np.testing.assert_array_equal(ring.get_window(), np.arange(3, 13))
+    np.testing.assert_array_equal(ring.get_window(4), np.arange(9, 13))
+
+    # Write larger than capacity keeps only the tail
+    ring.write(np.arange(100, 125, dtype=np.int16).tobytes())
+    np.testing.assert_array_equal(ring.get_window(), np.arange(115, 125))
+
+    ring.clear()
+    assert len(ring) == 0
+    assert len(ring.get_window()) == 0
+
+
+def test_ring_buffer_split_sample():
+    """Test a sample split across writes is reassembled"""
+    ring = AudioRingBuffer(capacity=10)
+    data = np.array([1, -2, 300], dtype=np.int16).tobytes()
+
+    ring.write(data[:3])
+    ring.write(data[3:])
+
+    np.testing.assert_array_equal(ring.get_window(), [1, -2, 300])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,120 @@
+import pytest
+import json
+import os
+from src.config import (
+    Config, ModelConfig, AudioConfig, EndpointingConfig, PerformanceConfig
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Start each test without memoized configs"""
+    Config.clear_cache()
+    yield
+    Config.clear_cache()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """YAML config file with a few overrides"""
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "model:\n"
+        "  device: cpu\n"
+        "audio:\n"
+        "  chunk_duration: 0.5\n"
+        "performance:\n"
+        "  max_batch_size: 2\n"
+    )
+    return str(path)
+
+
+def test_load_from_yaml(config_file):
+    """Test values from the YAML file override defaults"""
+    config = Config.load(config_file)
+
+    assert config.model.device == "cpu"
+    assert config.audio.chunk_duration == 0.5
+    assert config.performance.max_batch_size == 2
+    assert config.audio.sample_rate == 16000  # Default
+
+
+def test_yaml_cache_written_and_reused(config_file):
+    """Test parsed YAML is cached as JSON and used on the next load"""
+    Config.load(config_file)
+
+    cache_path = config_file + ".cache.json"
+    assert os.path.exists(cache_path)
+    with open(cache_path) as f:
+        cached = json.load(f)
+    assert cached["data"]["model"]["device"] == "cpu"
+
+    # A cache keyed to the unchanged YAML file is trusted over it
+    cached["data"] = {"model": {"device": "cuda"}}
+    with open(cache_path, "w") as f:
+        json.dump(cached, f)
+
+    Config.clear_cache()
+    assert Config.load(config_file).model.device == "cuda"
+
+
+def test_yaml_cache_invalidated_by_replaced_yaml(config_file):
+    """Test replacing the YAML file invalidates the cache, even with an older mtime"""
+    Config.load(config_file)
+    cache_path = config_file + ".cache.json"
+
+    with open(config_file) as f:
+        original = f.read()
+    with open(config_file, "w") as f:
+        f.write(original.replace("device: cpu", "device: gpu"))
+    stat = os.stat(cache_path)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    Config.clear_cache()
+    assert Config.load(config_file).model.device == "gpu"
+
+
+def test_load_from_env(monkeypatch):
+    """Test environment variables override defaults"""
+    monkeypatch.setenv("ASR_DEVICE", "cpu")
+    monkeypatch.setenv("ASR_CHUNK_DURATION", "0.5")
+    monkeypatch.setenv("MAX_BATCH_SIZE", "8")
+    monkeypatch.setenv("VAD_ENABLED", "TRUE")
+    monkeypatch.setenv("WARMUP_ENABLED", "")  # Empty falls back to default
+
+    config = Config.load()
+
+    assert config.model.device == "cpu"
+    assert config.audio.chunk_duration == 0.5
+    assert config.performance.max_batch_size == 8
+    assert config.endpointing.vad_enabled is True
+    assert config.performance.warmup_enabled is True
+
+
+def test_load_is_memoized(config_file, monkeypatch):
+    """Test repeated loads return the same instance until inputs change"""
+    config = Config.load(config_file)
+    assert Config.load(config_file) is config
+
+    monkeypatch.setenv("ASR_DEVICE", "cuda")
+    assert Config.load() is not Config.load(config_file)
+    assert Config.load().model.device == "cuda"
+
+
+def test_to_dict_round_trip():
+    """Test to_dict covers every field and rebuilds an equal config"""
+    config = Config.load()
+    data = config.to_dict()
+
+    assert data["performance"]["max_batch_size"] == config.performance.max_batch_size
+    assert data["endpointing"]["vad_threshold"] == config.endpointing.vad_threshold
+    assert Config(
+        model=ModelConfig(**data["model"]),
+        audio=AudioConfig(**data["audio"]),
+        endpointing=EndpointingConfig(**data["endpointing"]),
+        performance=PerformanceConfig(**data["performance"])
+    ) == config
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
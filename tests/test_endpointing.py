@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 import time
+from unittest.mock import Mock, MagicMock, patch
 from src.endpointing import Endpointing
 from src.config import EndpointingConfig
 
@@ -232,5 +233,37 @@ def test_vad_initialization():
         assert ep.strategy == "energy"  # Fallback
 
 
+def test_energy_threshold_boundary():
+    """Test squared-energy comparison matches the RMS threshold"""
+    config = EndpointingConfig(strategy="energy", energy_threshold=0.01, silence_duration=0.5)
+
+    # Constant signal has RMS equal to its amplitude
+    ep = Endpointing(config)
+    ep.process_audio(np.full(16000, 0.0099, dtype=np.float32))
+    assert ep.is_in_silence() is True
+
+    ep = Endpointing(config)
+    ep.process_audio(np.full(16000, 0.0101, dtype=np.float32))
+    assert ep.is_in_silence() is False
+    assert ep.speech_detected is True
+
+
+def test_vad_energy_gate_skips_model():
+    """Test clearly silent or loud chunks bypass the VAD model"""
+    config = EndpointingConfig(strategy="vad", energy_threshold=0.01, silence_duration=0.5)
+    ep = Endpointing(config)
+    ep.strategy = "vad"
+    ep.vad_model = Mock(side_effect=AssertionError("VAD model should not run"))
+
+    with patch('src.endpointing.torch', MagicMock()):
+        ep.process_audio(np.full(16000, 0.001, dtype=np.float32))
+        assert ep.is_in_silence() is True
+
+        ep.process_audio(np.full(16000, 0.5, dtype=np.float32))
+        assert ep.is_in_silence() is False
+    assert ep.speech_detected is True
+    ep.vad_model.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
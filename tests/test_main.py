@@ -0,0 +1,72 @@
+import json
+import pytest
+from unittest.mock import AsyncMock
+import src.main
+from src.main import _json_dumps, coalesce_results, send_message
+from src.session import SessionState
+
+
+def partial(text):
+    return {"type": "partial_transcript", "text": text, "is_partial": True}
+
+
+def final(text):
+    return {"type": "final_transcript", "text": text, "is_partial": False}
+
+
+def test_coalesce_keeps_last_partial():
+    """Test that only the newest of consecutive partials is sent"""
+    assert coalesce_results([partial("hel"), partial("hello")]) == [partial("hello")]
+
+
+def test_coalesce_keeps_finals_and_trailing_partial():
+    """Test that a final survives and a partial after it is still current"""
+    results = [partial("hello"), final("hello"), partial("how")]
+
+    assert coalesce_results(results) == [final("hello"), partial("how")]
+
+
+def test_coalesce_finals_unchanged():
+    """Test that final transcripts are all kept, in order"""
+    results = [final("one"), final("two"), final("three")]
+
+    assert coalesce_results(results) == results
+
+
+def test_coalesce_empty():
+    """Test that no results stay no results"""
+    assert coalesce_results([]) == []
+
+
+def test_json_dumps_stdlib(monkeypatch):
+    """Test the stdlib fallback encodes compactly, with str enums as values"""
+    monkeypatch.setattr(src.main, "orjson", None)
+
+    message = {"type": "x", "state": SessionState.STREAMING}
+    assert _json_dumps(message) == '{"type":"x","state":"streaming"}'
+
+
+def test_json_dumps_orjson():
+    """Test the orjson path matches the stdlib fallback"""
+    pytest.importorskip("orjson")
+    assert src.main.orjson is not None
+
+    message = {"type": "x", "state": SessionState.STREAMING, "text": "héllo"}
+    assert _json_dumps(message) == '{"type":"x","state":"streaming","text":"héllo"}'
+
+
+@pytest.mark.asyncio
+async def test_send_message_sends_text_frame():
+    """Test that messages go out as one JSON text frame"""
+    websocket = AsyncMock()
+
+    await send_message(websocket, {"type": "error", "message": "bad"})
+
+    websocket.send_text.assert_awaited_once()
+    assert json.loads(websocket.send_text.await_args.args[0]) == {
+        "type": "error", "message": "bad"
+    }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from src.session import TranscriptionSession, SessionState
+from src.config import Config, AudioConfig, EndpointingConfig
+
+
+@pytest.fixture
+def config():
+    """Default configuration"""
+    return Config()
+
+
+def make_engine(texts):
+    """Mock ASR engine returning the given texts for each batch"""
+    engine = AsyncMock()
+    engine.transcribe_batch.side_effect = lambda chunks: [
+        {"text": text, "confidence": 1.0, "is_partial": True}
+        for text in texts[:len(chunks)]
+    ]
+    return engine
+
+
+def silence_bytes(seconds: float) -> bytes:
+    """Digital silence"""
+    return bytes(2 * int(16000 * seconds))
+
+
+def speech_bytes(seconds: float) -> bytes:
+    """Loud random PCM audio (well above the energy threshold)"""
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-16000, 16000, int(16000 * seconds), dtype=np.int16)
+    return samples.tobytes()
+
+
+@pytest.mark.asyncio
+async def test_add_audio_requires_streaming(config):
+    """Test audio is rejected before streaming starts"""
+    session = TranscriptionSession("s1", make_engine(["hi"]), config)
+
+    with pytest.raises(ValueError, match="Cannot add audio"):
+        await session.add_audio_chunk(speech_bytes(1.0))
+
+
+@pytest.mark.asyncio
+async def test_add_audio_returns_partials(config):
+    """Test each ready chunk produces a partial transcript"""
+    engine = make_engine(["hello", "hello world"])
+    session = TranscriptionSession("s1", engine, config)
+    await session.start_streaming()
+
+    # 2.5s of audio: two full 1s chunks are ready
+    results = await session.add_audio_chunk(speech_bytes(2.5))
+
+    assert [r["text"] for r in results] == ["hello", "hello world"]
+    assert all(r["type"] == "partial_transcript" for r in results)
+    engine.transcribe_batch.assert_awaited_once()
+    assert len(engine.transcribe_batch.await_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_results_dropped_if_closed_during_inference(config):
+    """Test results arriving after the session closed are discarded"""
+    engine = AsyncMock()
+    session = TranscriptionSession("s1", engine, config)
+    await session.start_streaming()
+
+    async def close_then_transcribe(chunks):
+        await session.close()
+        return [{"text": "late", "confidence": 1.0, "is_partial": True}] * len(chunks)
+
+    engine.transcribe_batch.side_effect = close_then_transcribe
+
+    results = await session.add_audio_chunk(speech_bytes(1.5))
+
+    assert results == []
+    assert session.state is SessionState.CLOSED
+    assert session.current_partial == ""
+
+
+def test_final_transcript_joined(config):
+    """Test finalized utterances are joined and kept up to date"""
+    session = TranscriptionSession("s1", make_engine(["one"]), config)
+    assert session.get_final_transcript() == ""
+
+    session._add_final_transcript("hello there")
+    session._add_final_transcript("how are you")
+    assert session.get_final_transcript() == "hello there how are you"
+
+    session._add_final_transcript("today")
+    assert session.get_final_transcript() == "hello there how are you today"
+
+
+@pytest.mark.asyncio
+async def test_silence_skips_asr(config):
+    """Test silent chunks are not sent to the ASR engine"""
+    engine = make_engine(["should not appear"])
+    session = TranscriptionSession("s1", engine, config)
+    await session.start_streaming()
+
+    results = await session.add_audio_chunk(silence_bytes(2.5))
+
+    assert results == []
+    engine.transcribe_batch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_endpoint_finalizes_without_asr():
+    """Test an endpoint finalizes the partial and skips ASR for silence"""
+    config = Config(
+        audio=AudioConfig(left_context_duration=0.0),
+        endpointing=EndpointingConfig(strategy="energy", silence_duration=0.0)
+    )
+    engine = make_engine(["hello"])
+    session = TranscriptionSession("s1", engine, config)
+    await session.start_streaming()
+
+    # Speech chunk, then two silent chunks: silence starts, then endpoint
+    results = await session.add_audio_chunk(speech_bytes(1.0) + silence_bytes(2.5))
+
+    assert [(r["type"], r["text"]) for r in results] == [
+        ("partial_transcript", "hello"),
+        ("final_transcript", "hello"),
+    ]
+    assert len(engine.transcribe_batch.await_args.args[0]) == 1
+    assert session.get_final_transcript() == "hello"
+    assert session.current_partial == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])